@@ -0,0 +1,38 @@
+import random
+from typing import TYPE_CHECKING, Iterator, List, cast
+
+import pytest
+
+from tests.utils import Printer, builtin_print, pprint_default
+
+if TYPE_CHECKING:  # pragma: no cover
+    from _pytest.config import Config
+    from _pytest.config.argparsing import Parser
+
+
+def pytest_addoption(parser: "Parser") -> None:
+    parser.addoption(
+        "--slow", action="store_true", default=False, help="run slow tests"
+    )
+
+
+def pytest_collection_modifyitems(config: "Config", items: List[pytest.Item]) -> None:
+    if config.getoption("--slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --slow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(autouse=True)
+def deterministic_random() -> Iterator[None]:
+    """Seed the random module so that generated trees are reproducible."""
+    random.seed(0)
+    yield
+
+
+@pytest.fixture(params=[builtin_print, pprint_default], ids=["print", "pprint"])
+def printer(request: pytest.FixtureRequest) -> Printer:
+    """Return a helper that prints a tree and returns the captured lines."""
+    return cast(Printer, request.param)
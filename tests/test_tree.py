@@ -1,13 +1,13 @@
-from __future__ import absolute_import, unicode_literals
-
-import copy
 import random
-from typing import Any, List, Optional
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Callable, List, Mapping, Optional, Pattern, Tuple, Type
 
 import pytest
 
 from binarytree import (
     Node,
+    NodeValueList,
     bst,
     build,
     build2,
@@ -26,7 +26,7 @@ from binarytree.exceptions import (
     NodeValueError,
     TreeHeightError,
 )
-from tests.utils import builtin_print, pprint_default, pprint_with_index
+from tests.utils import Printer, exact_message, pprint_with_index
 
 REPETITIONS = 20
 
@@ -83,289 +83,319 @@ EXPECTED_SVG_XML_MULTIPLE_NODES = """
 </g>
 </svg>
 """
-EMPTY_LIST: List[Optional[int]] = []
+EMPTY_VALUE: Tuple[()] = ()
+
+INVALID_NODE_VALUE = exact_message("node value must be a float/int/str")
+INVALID_LEFT_CHILD = exact_message("left child must be a Node instance")
+INVALID_RIGHT_CHILD = exact_message("right child must be a Node instance")
+INVALID_NODE_INDEX = exact_message("node index must be a non-negative int")
+INVALID_TREE_HEIGHT = exact_message("height must be an int between 0 - 9")
+
+NODE_INIT_ERROR_CASES = (
+    ((EMPTY_VALUE,), NodeValueError, INVALID_NODE_VALUE),
+    ((1, "this_is_not_a_node"), NodeTypeError, INVALID_LEFT_CHILD),
+    ((1, Node(1), "this_is_not_a_node"), NodeTypeError, INVALID_RIGHT_CHILD),
+)
 
+NODE_SETATTR_ERROR_CASES = (
+    ("val", EMPTY_VALUE, NodeValueError, INVALID_NODE_VALUE),
+    ("value", EMPTY_VALUE, NodeValueError, INVALID_NODE_VALUE),
+    ("left", "this_is_not_a_node", NodeTypeError, INVALID_LEFT_CHILD),
+    ("right", "this_is_not_a_node", NodeTypeError, INVALID_RIGHT_CHILD),
+)
 
-def test_node_init_and_setattr_with_integers() -> None:
-    root = Node(1)
-    assert root.left is None
-    assert root.right is None
-    assert root.val == 1
-    assert root.value == 1
-    assert repr(root) == "Node(1)"
+# Path from Node(1) to the parent, child attribute and value of each node
+# inserted into the tree, followed by its expected list representation.
+LIST_REPRESENTATION_INSERTIONS = (
+    ((), "right", 3, [1, None, 3]),
+    ((), "left", 2, [1, 2, 3]),
+    (("right",), "left", 4, [1, 2, 3, None, None, 4]),
+    (("right",), "right", 5, [1, 2, 3, None, None, 4, 5]),
+    (("left",), "left", 6, [1, 2, 3, 6, None, 4, 5]),
+    (("left",), "right", 7, [1, 2, 3, 6, 7, 4, 5]),
+)
 
-    root.value = 2
-    assert root.value == 2
-    assert root.val == 2
-    assert repr(root) == "Node(2)"
+# List representations shared by build() and build2(), each followed by a
+# function constructing a fresh equivalent reference tree node by node.
+LIST_REPRESENTATION_TREES: Tuple[Tuple[NodeValueList, Callable[[], Node]], ...] = (
+    ([1], lambda: Node(1)),
+    ([1, 2], lambda: Node(1, Node(2))),
+    ([1, 2, 3], lambda: Node(1, Node(2), Node(3))),
+    ([1, 2, 3, None, 4], lambda: Node(1, Node(2, None, Node(4)), Node(3))),
+)
 
-    root.val = 1
-    assert root.value == 1
-    assert root.val == 1
-    assert repr(root) == "Node(1)"
+# Compact list representations understood only by build2().
+LIST_REPRESENTATION_2_TREES: Tuple[Tuple[NodeValueList, Callable[[], Node]], ...] = (
+    ([1, None, 2, 3, 4], lambda: Node(1, None, Node(2, Node(3), Node(4)))),
+    ([2, 5, None, 3, None, 1, 4], lambda: Node(2, Node(5, Node(3, Node(1), Node(4))))),
+)
 
-    left_child = Node(2)
-    root.left = left_child
-    assert root.left is left_child
-    assert root.right is None
-    assert root.val == 1
-    assert root.left.left is None
-    assert root.left.right is None
-    assert root.left.val == 2
-    assert repr(left_child) == "Node(2)"
+# List representation of the tree shared by the level-order index tests.
+SIX_NODE_VALUES = [1, 2, 3, 4, 5, None, None, None, None, 6]
 
-    right_child = Node(3)
-    root.right = right_child
-    assert root.left is left_child
-    assert root.right is right_child
-    assert root.val == 1
-    assert root.right.left is None
-    assert root.right.right is None
-    assert root.right.val == 3
-    assert repr(right_child) == "Node(3)"
-
-    last_node = Node(4)
-    left_child.right = last_node
-    assert root.left.right is last_node
-    assert repr(root.left.right) == "Node(4)"
 
+SINGLE_NODE_PROPERTIES = MappingProxyType(
+    {
+        "height": 0,
+        "is_balanced": True,
+        "is_bst": True,
+        "is_complete": True,
+        "is_max_heap": True,
+        "is_min_heap": True,
+        "is_perfect": True,
+        "is_strict": True,
+        "is_symmetric": True,
+        "leaf_count": 1,
+        "max_leaf_depth": 0,
+        "max_node_value": 1,
+        "min_leaf_depth": 0,
+        "min_node_value": 1,
+        "size": 1,
+    }
+)
+
+# List representations of trees grown one node at a time from Node(1),
+# followed by the expected properties of each tree.
+TREE_PROPERTIES = (
+    ([1], SINGLE_NODE_PROPERTIES),
+    (
+        [1, 2],
+        MappingProxyType(
+            {
+                "height": 1,
+                "is_balanced": True,
+                "is_bst": False,
+                "is_complete": True,
+                "is_max_heap": False,
+                "is_min_heap": True,
+                "is_perfect": False,
+                "is_strict": False,
+                "is_symmetric": False,
+                "leaf_count": 1,
+                "max_leaf_depth": 1,
+                "max_node_value": 2,
+                "min_leaf_depth": 1,
+                "min_node_value": 1,
+                "size": 2,
+            }
+        ),
+    ),
+    (
+        [1, 2, 3],
+        MappingProxyType(
+            {
+                "height": 1,
+                "is_balanced": True,
+                "is_bst": False,
+                "is_complete": True,
+                "is_max_heap": False,
+                "is_min_heap": True,
+                "is_perfect": True,
+                "is_strict": True,
+                "is_symmetric": False,
+                "leaf_count": 2,
+                "max_leaf_depth": 1,
+                "max_node_value": 3,
+                "min_leaf_depth": 1,
+                "min_node_value": 1,
+                "size": 3,
+            }
+        ),
+    ),
+    (
+        [1, 2, 3, 4],
+        MappingProxyType(
+            {
+                "height": 2,
+                "is_balanced": True,
+                "is_bst": False,
+                "is_complete": True,
+                "is_max_heap": False,
+                "is_min_heap": True,
+                "is_perfect": False,
+                "is_strict": False,
+                "is_symmetric": False,
+                "leaf_count": 2,
+                "max_leaf_depth": 2,
+                "max_node_value": 4,
+                "min_leaf_depth": 1,
+                "min_node_value": 1,
+                "size": 4,
+            }
+        ),
+    ),
+    (
+        [1, 2, 3, 4, None, 5],
+        MappingProxyType(
+            {
+                "height": 2,
+                "is_balanced": True,
+                "is_bst": False,
+                "is_complete": False,
+                "is_max_heap": False,
+                "is_min_heap": False,
+                "is_perfect": False,
+                "is_strict": False,
+                "is_symmetric": False,
+                "leaf_count": 2,
+                "max_leaf_depth": 2,
+                "max_node_value": 5,
+                "min_leaf_depth": 2,
+                "min_node_value": 1,
+                "size": 5,
+            }
+        ),
+    ),
+    (
+        [1, 2, 3, 4, None, 5, None, None, None, None, None, 6],
+        MappingProxyType(
+            {
+                "height": 3,
+                "is_balanced": False,
+                "is_bst": False,
+                "is_complete": False,
+                "is_max_heap": False,
+                "is_min_heap": False,
+                "is_perfect": False,
+                "is_strict": False,
+                "is_symmetric": False,
+                "leaf_count": 2,
+                "max_leaf_depth": 3,
+                "max_node_value": 6,
+                "min_leaf_depth": 2,
+                "min_node_value": 1,
+                "size": 6,
+            }
+        ),
+    ),
+    (
+        [1, 2, 3, 4, None, 5, None, 7, None, None, None, 6],
+        MappingProxyType(
+            {
+                "height": 3,
+                "is_balanced": False,
+                "is_bst": False,
+                "is_complete": False,
+                "is_max_heap": False,
+                "is_min_heap": False,
+                "is_perfect": False,
+                "is_strict": False,
+                "is_symmetric": False,
+                "leaf_count": 2,
+                "max_leaf_depth": 3,
+                "max_node_value": 7,
+                "min_leaf_depth": 3,
+                "min_node_value": 1,
+                "size": 7,
+            }
+        ),
+    ),
+)
 
-def test_node_init_and_setattr_with_floats() -> None:
-    root = Node(1.5)
-    assert root.left is None
-    assert root.right is None
-    assert root.val == 1.5
-    assert root.value == 1.5
-    assert repr(root) == "Node(1.5)"
 
-    root.value = 2.5
-    assert root.value == 2.5
-    assert root.val == 2.5
-    assert repr(root) == "Node(2.5)"
+def assert_shape(
+    node: Node, value: Any, left: Optional[Node], right: Optional[Node]
+) -> None:
+    """Assert the value and the exact child nodes of the given node."""
+    assert (node.val, node.left, node.right) == (value, left, right)
 
-    root.val = 1.5
-    assert root.value == 1.5
-    assert root.val == 1.5
-    assert repr(root) == "Node(1.5)"
 
-    left_child = Node(2.5)
+@pytest.mark.parametrize(
+    "values",
+    [(1, 2, 3, 4), (1.5, 2.5, 3.5, 4.5), ("A", "B", "C", "D")],
+    ids=["integers", "floats", "letters"],
+)
+def test_node_init_and_setattr(values: Tuple[Any, Any, Any, Any]) -> None:
+    a, b, c, d = values
+    root = Node(a)
+    assert_shape(root, a, None, None)
+    assert root.value == a
+    assert repr(root) == "Node({})".format(a)
+
+    root.value = b
+    assert (root.value, root.val) == (b, b)
+    assert repr(root) == "Node({})".format(b)
+
+    root.val = a
+    assert (root.value, root.val) == (a, a)
+    assert repr(root) == "Node({})".format(a)
+
+    left_child = Node(b)
     root.left = left_child
-    assert root.left is left_child
-    assert root.right is None
-    assert root.val == 1.5
-    assert root.left.left is None
-    assert root.left.right is None
-    assert root.left.val == 2.5
-    assert repr(left_child) == "Node(2.5)"
+    assert_shape(root, a, left_child, None)
+    assert_shape(left_child, b, None, None)
+    assert repr(left_child) == "Node({})".format(b)
 
-    right_child = Node(3.5)
+    right_child = Node(c)
     root.right = right_child
-    assert root.left is left_child
-    assert root.right is right_child
-    assert root.val == 1.5
-    assert root.right.left is None
-    assert root.right.right is None
-    assert root.right.val == 3.5
-    assert repr(right_child) == "Node(3.5)"
-
-    last_node = Node(4.5)
-    left_child.right = last_node
-    assert root.left.right is last_node
-    assert repr(root.left.right) == "Node(4.5)"
-
+    assert_shape(root, a, left_child, right_child)
+    assert_shape(right_child, c, None, None)
+    assert repr(right_child) == "Node({})".format(c)
 
-def test_node_init_and_setattr_with_letters() -> None:
-    root = Node("A")
-    assert root.left is None
-    assert root.right is None
-    assert root.val == "A"
-    assert root.value == "A"
-    assert repr(root) == "Node(A)"
+    last_node = Node(d)
+    left_child.right = last_node
+    assert_shape(left_child, b, None, last_node)
+    assert repr(last_node) == "Node({})".format(d)
 
-    root.value = "B"
-    assert root.value == "B"
-    assert root.val == "B"
-    assert repr(root) == "Node(B)"
 
-    root.val = "A"
-    assert root.value == "A"
-    assert root.val == "A"
-    assert repr(root) == "Node(A)"
+@pytest.mark.parametrize("args,error,message", NODE_INIT_ERROR_CASES)
+def test_node_init_error_cases(
+    args: Tuple[Any, ...], error: Type[Exception], message: Pattern[str]
+) -> None:
+    with pytest.raises(error, match=message):
+        Node(*args)
 
-    left_child = Node("B")
-    root.left = left_child
-    assert root.left is left_child
-    assert root.right is None
-    assert root.val == "A"
-    assert root.left.left is None
-    assert root.left.right is None
-    assert root.left.val == "B"
-    assert repr(left_child) == "Node(B)"
 
-    right_child = Node("C")
-    root.right = right_child
-    assert root.left is left_child
-    assert root.right is right_child
-    assert root.val == "A"
-    assert root.right.left is None
-    assert root.right.right is None
-    assert root.right.val == "C"
-    assert repr(right_child) == "Node(C)"
-
-    last_node = Node("D")
-    left_child.right = last_node
-    assert root.left.right is last_node
-    assert repr(root.left.right) == "Node(D)"
+@pytest.mark.parametrize("attr,value,error,message", NODE_SETATTR_ERROR_CASES)
+def test_node_setattr_error_cases(
+    attr: str, value: Any, error: Type[Exception], message: Pattern[str]
+) -> None:
+    root = Node(1, Node(2), Node(3))
+    original = getattr(root, attr)
 
+    with pytest.raises(error, match=message):
+        setattr(root, attr, value)
+    assert getattr(root, attr) is original
 
-def test_node_init_and_setattr_error_cases() -> None:
-    root, left_child, right_child = Node(1), Node(2), Node(3)
-    root.left = left_child
-    root.right = right_child
 
-    with pytest.raises(NodeValueError) as err1:
-        Node(EMPTY_LIST)
-    assert str(err1.value) == "node value must be a float/int/str"
-
-    with pytest.raises(NodeValueError) as err2:
-        Node(1).val = EMPTY_LIST
-    assert str(err2.value) == "node value must be a float/int/str"
-
-    with pytest.raises(NodeTypeError) as err3:
-        Node(1, "this_is_not_a_node")  # type: ignore
-    assert str(err3.value) == "left child must be a Node instance"
-
-    with pytest.raises(NodeTypeError) as err4:
-        Node(1, Node(1), "this_is_not_a_node")  # type: ignore
-    assert str(err4.value) == "right child must be a Node instance"
-
-    with pytest.raises(NodeTypeError) as err5:
-        root.left = "this_is_not_a_node"  # type: ignore
-    assert root.left is left_child
-    assert str(err5.value) == "left child must be a Node instance"
-
-    with pytest.raises(NodeTypeError) as err6:
-        root.right = "this_is_not_a_node"  # type: ignore
-    assert root.right is right_child
-    assert str(err6.value) == "right child must be a Node instance"
-
-
-def test_tree_equals_with_integers() -> None:
-    root1 = Node(1)
-    root2 = Node(1)
-    assert root1.equals(None) is False  # type: ignore
-    assert root1.equals(1) is False  # type: ignore
-    assert root1.equals(Node(2)) is False
-    assert root1.equals(root2) is True
-    assert root2.equals(root1) is True
-
-    root1.left = Node(2)
-    assert root1.equals(root2) is False
-    assert root2.equals(root1) is False
-
-    root2.left = Node(2)
-    assert root1.equals(root2) is True
-    assert root2.equals(root1) is True
-
-    root1.right = Node(3)
-    assert root1.equals(root2) is False
-    assert root2.equals(root1) is False
-
-    root2.right = Node(3)
-    assert root1.equals(root2) is True
-    assert root2.equals(root1) is True
-
-    root1.right.left = Node(4)
-    assert root1.equals(root2) is False
-    assert root2.equals(root1) is False
-
-    root2.right.left = Node(4)
-    assert root1.equals(root2) is True
-    assert root2.equals(root1) is True
-
-
-def test_tree_equals_with_floats() -> None:
-    root1 = Node(1.5)
-    root2 = Node(1.5)
-    assert root1.equals(None) is False  # type: ignore
-    assert root1.equals(1.5) is False  # type: ignore
-    assert root1.equals(Node(2.5)) is False
-    assert root1.equals(root2) is True
-    assert root2.equals(root1) is True
-
-    root1.left = Node(2.5)
-    assert root1.equals(root2) is False
-    assert root2.equals(root1) is False
-
-    root2.left = Node(2.5)
-    assert root1.equals(root2) is True
-    assert root2.equals(root1) is True
-
-    root1.right = Node(3.5)
-    assert root1.equals(root2) is False
-    assert root2.equals(root1) is False
-
-    root2.right = Node(3.5)
-    assert root1.equals(root2) is True
-    assert root2.equals(root1) is True
-
-    root1.right.left = Node(4.5)
-    assert root1.equals(root2) is False
-    assert root2.equals(root1) is False
-
-    root2.right.left = Node(4.5)
-    assert root1.equals(root2) is True
-    assert root2.equals(root1) is True
-
-
-def test_tree_equals_with_letters() -> None:
-    root1 = Node("A")
-    root2 = Node("A")
-    assert root1.equals(None) is False  # type: ignore
-    assert root1.equals("A") is False  # type: ignore
-    assert root1.equals(Node("B")) is False
-    assert root1.equals(root2) is True
-    assert root2.equals(root1) is True
-
-    root1.left = Node("B")
-    assert root1.equals(root2) is False
-    assert root2.equals(root1) is False
-
-    root2.left = Node("B")
-    assert root1.equals(root2) is True
-    assert root2.equals(root1) is True
-
-    root1.right = Node("C")
-    assert root1.equals(root2) is False
-    assert root2.equals(root1) is False
-
-    root2.right = Node("C")
-    assert root1.equals(root2) is True
-    assert root2.equals(root1) is True
-
-    root1.right.left = Node("D")
-    assert root1.equals(root2) is False
-    assert root2.equals(root1) is False
-
-    root2.right.left = Node("D")
-    assert root1.equals(root2) is True
-    assert root2.equals(root1) is True
-
-
-def test_tree_clone_with_numbers() -> None:
-    for _ in range(REPETITIONS):
-        root = tree(letters=False)
-        assert root is not None
-        clone = root.clone()
-        assert root.values == clone.values
-        assert root.equals(clone)
-        assert clone.equals(root)
-        assert root.properties == clone.properties
-
-
-def test_tree_clone_with_letters() -> None:
-    for _ in range(REPETITIONS):
-        root = tree(letters=True)
+@pytest.mark.parametrize(
+    "values",
+    [(1, 2, 3, 4), (1.5, 2.5, 3.5, 4.5), ("A", "B", "C", "D")],
+    ids=["integers", "floats", "letters"],
+)
+def test_tree_equals(values: Tuple[Any, Any, Any, Any]) -> None:
+    a, b, c, d = values
+    root = Node(a)
+    assert root.equals(None) is False  # type: ignore
+    assert root.equals(a) is False
+    assert root.equals(Node(b)) is False
+
+    # Each stage adds one node to the tree built in the stage before it.
+    stages = [[a], [a, b], [a, b, c], [a, b, c, None, None, d]]
+    previous = None
+    for stage in stages:
+        root1 = build(stage)
+        root2 = build(stage)
+        assert root1 is not None and root2 is not None
+        assert root1.equals(root2) is True
+        assert root2.equals(root1) is True
+        if previous is not None:
+            assert root1.equals(previous) is False
+            assert previous.equals(root1) is False
+        previous = root1
+
+
+@pytest.fixture(scope="module", params=[False, True], ids=["numbers", "letters"])
+def random_tree_values(request: pytest.FixtureRequest) -> List[NodeValueList]:
+    """Return list representations of random trees, generated once per module."""
+    random.seed(0)
+    trees = [tree(letters=request.param) for _ in range(REPETITIONS)]
+    return [root.values for root in trees if root is not None]
+
+
+def test_tree_clone(random_tree_values: List[NodeValueList]) -> None:
+    for values in random_tree_values:
+        root = build(values)
         assert root is not None
         clone = root.clone()
         assert root.values == clone.values
@@ -375,173 +405,54 @@ def test_tree_clone_with_letters() -> None:
 
 
 def test_list_representation_1() -> None:
-    root = build(EMPTY_LIST)
+    root = build([])
     assert root is None
 
-    root = build([1])
-    assert root is not None
-    assert root.val == 1
-    assert root.left is None
-    assert root.right is None
-
-    root = build([1, 2])
-    assert root is not None
-    assert root.val == 1
-    assert root.left is not None
-    assert root.left.val == 2
-    assert root.right is None
+    for values, reference in LIST_REPRESENTATION_TREES:
+        root = build(values)
+        assert root is not None
+        assert root.equals(reference())
 
-    root = build([1, 2, 3])
-    assert root is not None
-    assert root.val == 1
-    assert root.left is not None
-    assert root.left.val == 2
-    assert root.right is not None
-    assert root.right.val == 3
-    assert root.left.left is None
-    assert root.left.right is None
-    assert root.right.left is None
-    assert root.right.right is None
-
-    root = build([1, 2, 3, None, 4])
-    assert root is not None
-    assert root.val == 1
-    assert root.left is not None
-    assert root.left.val == 2
-    assert root.right is not None
-    assert root.right.val == 3
-    assert root.left.left is None
-    assert root.left.right is not None
-    assert root.left.right.val == 4
-    assert root.right.left is None
-    assert root.right.right is None
-    assert root.left.right.left is None
-    assert root.left.right.right is None
-
-    with pytest.raises(NodeNotFoundError) as err:
+    with pytest.raises(
+        NodeNotFoundError, match=exact_message("parent node missing at index 0")
+    ):
         build([None, 1, 2])
-    assert str(err.value) == "parent node missing at index 0"
 
-    with pytest.raises(NodeNotFoundError) as err:
+    with pytest.raises(
+        NodeNotFoundError, match=exact_message("parent node missing at index 1")
+    ):
         build([1, None, 2, 3, 4])
-    assert str(err.value) == "parent node missing at index 1"
 
     root = Node(1)
     assert root.values == [1]
-
-    root.right = Node(3)
-    assert root.values == [1, None, 3]
-
-    root.left = Node(2)
-    assert root.values == [1, 2, 3]
-
-    root.right.left = Node(4)
-    assert root.values == [1, 2, 3, None, None, 4]
-
-    root.right.right = Node(5)
-    assert root.values == [1, 2, 3, None, None, 4, 5]
-
-    root.left.left = Node(6)
-    assert root.values == [1, 2, 3, 6, None, 4, 5]
-
-    root.left.right = Node(7)
-    assert root.values == [1, 2, 3, 6, 7, 4, 5]
-
-    for _ in range(REPETITIONS):
-        t1 = tree()
-        assert t1 is not None
-
-        t2 = build(t1.values)
-        assert t2 is not None
-
-        assert t1.values == t2.values
+    for path, attr, value, expected in LIST_REPRESENTATION_INSERTIONS:
+        parent = root
+        for name in path:
+            parent = getattr(parent, name)
+        setattr(parent, attr, Node(value))
+        assert root.values == expected
 
 
 def test_list_representation_2() -> None:
-    root = build2(EMPTY_LIST)
+    root = build2([])
     assert root is None
 
-    root = build2([1])
-    assert root is not None
-    assert root.val == 1
-    assert root.left is None
-    assert root.right is None
-
-    root = build2([1, 2])
-    assert root is not None
-    assert root.val == 1
-    assert root.left is not None
-    assert root.left.val == 2
-    assert root.right is None
-
-    root = build2([1, 2, 3])
-    assert root is not None
-    assert root.val == 1
-    assert root.left is not None
-    assert root.left.val == 2
-    assert root.right is not None
-    assert root.right.val == 3
-    assert root.left.left is None
-    assert root.left.right is None
-    assert root.right.left is None
-    assert root.right.right is None
-
-    root = build2([1, 2, 3, None, 4])
-    assert root is not None
-    assert root.val == 1
-    assert root.left is not None
-    assert root.left.val == 2
-    assert root.right is not None
-    assert root.right.val == 3
-    assert root.left.left is None
-    assert root.left.right is not None
-    assert root.left.right.val == 4
-    assert root.right.left is None
-    assert root.right.right is None
-    assert root.left.right.left is None
-    assert root.left.right.right is None
-
-    root = build2([1, None, 2, 3, 4])
-    assert root is not None
-    assert root.val == 1
-    assert root.left is None
-    assert root.right is not None
-    assert root.right.val == 2
-    assert root.right.left is not None
-    assert root.right.left.val == 3
-    assert root.right.right is not None
-    assert root.right.right.val == 4
-
-    root = build2([2, 5, None, 3, None, 1, 4])
-    assert root is not None
-    assert root.val == 2
-    assert root.left is not None
-    assert root.left.val == 5
-    assert root.right is None
-    assert root.left.left is not None
-    assert root.left.left.val == 3
-    assert root.left.left.left is not None
-    assert root.left.left.left.val == 1
-    assert root.left.left.right is not None
-    assert root.left.left.right.val == 4
+    for values, reference in LIST_REPRESENTATION_TREES + LIST_REPRESENTATION_2_TREES:
+        root = build2(values)
+        assert root is not None
+        assert root.equals(reference())
 
     with pytest.raises(NodeValueError):
         build2([None, 1, 2])
 
     root = Node(1)
     assert root.values2 == [1]
-    root.right = Node(3)
-    assert root.values2 == [1, None, 3]
-    root.left = Node(2)
-    assert root.values2 == [1, 2, 3]
-    root.right.left = Node(4)
-    assert root.values2 == [1, 2, 3, None, None, 4]
-    root.right.right = Node(5)
-    assert root.values2 == [1, 2, 3, None, None, 4, 5]
-    root.left.left = Node(6)
-    assert root.values2 == [1, 2, 3, 6, None, 4, 5]
-    root.left.right = Node(7)
-    assert root.values2 == [1, 2, 3, 6, 7, 4, 5]
+    for path, attr, value, expected in LIST_REPRESENTATION_INSERTIONS:
+        parent = root
+        for name in path:
+            parent = getattr(parent, name)
+        setattr(parent, attr, Node(value))
+        assert root.values2 == expected
 
     root = Node(1)
     assert root.values2 == [1]
@@ -557,23 +468,28 @@ def test_list_representation_2() -> None:
     root.left.left.right = Node(5)
     assert root.values2 == [1, 2, None, 3, None, 4, 5]
 
-    for _ in range(REPETITIONS):
-        t1 = tree()
-        assert t1 is not None
 
-        t2 = build2(t1.values2)
-        assert t2 is not None
+def test_list_representation_round_trip(
+    random_tree_values: List[NodeValueList],
+) -> None:
+    roots = [build(values) for values in random_tree_values]
+    assert [root.values for root in roots if root is not None] == random_tree_values
 
-        assert t1.values2 == t2.values2
+    values2 = [root.values2 for root in roots if root is not None]
+    roots2 = [build2(values) for values in values2]
+    assert [root.values2 for root in roots2 if root is not None] == values2
 
 
-def test_tree_get_node_by_level_order_index() -> None:
-    root = Node(1)
-    root.left = Node(2)
-    root.right = Node(3)
-    root.left.left = Node(4)
-    root.left.right = Node(5)
-    root.left.right.left = Node(6)
+@pytest.fixture
+def six_node_tree() -> Node:
+    """Return a fresh six-node tree for the index tests."""
+    root = build(SIX_NODE_VALUES)
+    assert root is not None
+    return root
+
+
+def test_tree_get_node_by_level_order_index(six_node_tree: Node) -> None:
+    root = six_node_tree
 
     assert root[0] is root
     assert root[1] is root.left
@@ -582,57 +498,49 @@ def test_tree_get_node_by_level_order_index() -> None:
     assert root[4] is root.left.right
     assert root[9] is root.left.right.left
 
-    for index in [5, 6, 7, 8, 10]:
-        with pytest.raises(NodeNotFoundError) as err1:
-            assert root[index]
-        assert str(err1.value) == "node missing at index {}".format(index)
-
-    with pytest.raises(NodeIndexError) as err2:
+    with pytest.raises(NodeIndexError, match=INVALID_NODE_INDEX):
         assert root[-1]
-    assert str(err2.value) == "node index must be a non-negative int"
 
 
-def test_tree_set_node_by_level_order_index() -> None:
-    root = Node(1)
-    root.left = Node(2)
-    root.right = Node(3)
-    root.left.left = Node(4)
-    root.left.right = Node(5)
-    root.left.right.left = Node(6)
+@pytest.mark.parametrize("index", [5, 6, 7, 8, 10])
+def test_tree_get_node_by_missing_level_order_index(
+    six_node_tree: Node, index: int
+) -> None:
+    root = six_node_tree
+    with pytest.raises(
+        NodeNotFoundError,
+        match=exact_message("node missing at index {}".format(index)),
+    ):
+        assert root[index]
+
+
+def test_tree_set_node_by_level_order_index(six_node_tree: Node) -> None:
+    root = six_node_tree
 
     new_node_1 = Node(7)
     new_node_2 = Node(8)
     new_node_3 = Node(9)
 
-    with pytest.raises(NodeModifyError) as err1:
+    with pytest.raises(
+        NodeModifyError, match=exact_message("cannot modify the root node")
+    ):
         root[0] = new_node_1
-    assert str(err1.value) == "cannot modify the root node"
 
-    with pytest.raises(NodeIndexError) as err2:
+    with pytest.raises(NodeIndexError, match=INVALID_NODE_INDEX):
         root[-1] = new_node_1
-    assert str(err2.value) == "node index must be a non-negative int"
 
-    with pytest.raises(NodeNotFoundError) as err3:
+    with pytest.raises(
+        NodeNotFoundError, match=exact_message("parent node missing at index 49")
+    ):
         root[100] = new_node_1
-    assert str(err3.value) == "parent node missing at index 49"
 
     root[10] = new_node_1
-    assert root.val == 1
-    assert root.left.val == 2
-    assert root.right.val == 3
-    assert root.left.left.val == 4
-    assert root.left.right.val == 5
-    assert root.left.right.left.val == 6
-    assert root.left.right.right is new_node_1
+    assert root.values == [1, 2, 3, 4, 5, None, None, None, None, 6, 7]
+    assert root[10] is new_node_1
 
     root[4] = new_node_2
-    assert root.val == 1
-    assert root.left.val == 2
-    assert root.right.val == 3
-    assert root.left.left.val == 4
-    assert root.left.right.val == 8
-    assert root.left.right.left is None
-    assert root.left.right.right is None
+    assert root.values == [1, 2, 3, 4, 8]
+    assert root[4] is new_node_2
 
     root[1] = new_node_3
     root[2] = new_node_2
@@ -640,594 +548,388 @@ def test_tree_set_node_by_level_order_index() -> None:
     assert root.right is new_node_2
 
 
-def test_tree_delete_node_by_level_order_index() -> None:
-    root = Node(1)
-    root.left = Node(2)
-    root.right = Node(3)
-    root.left.left = Node(4)
-    root.left.right = Node(5)
-    root.left.right.left = Node(6)
+def test_tree_delete_node_by_level_order_index(six_node_tree: Node) -> None:
+    root = six_node_tree
 
-    with pytest.raises(NodeModifyError) as err1:
+    with pytest.raises(
+        NodeModifyError, match=exact_message("cannot delete the root node")
+    ):
         del root[0]
-    assert str(err1.value) == "cannot delete the root node"
 
-    with pytest.raises(NodeIndexError) as err2:
+    with pytest.raises(NodeIndexError, match=INVALID_NODE_INDEX):
         del root[-1]
-    assert str(err2.value) == "node index must be a non-negative int"
 
-    with pytest.raises(NodeNotFoundError) as err3:
+    with pytest.raises(
+        NodeNotFoundError, match=exact_message("no node to delete at index 10")
+    ):
         del root[10]
-    assert str(err3.value) == "no node to delete at index 10"
 
-    with pytest.raises(NodeNotFoundError) as err4:
+    with pytest.raises(
+        NodeNotFoundError, match=exact_message("no node to delete at index 100")
+    ):
         del root[100]
-    assert str(err4.value) == "no node to delete at index 100"
 
     del root[3]
-    assert root.left.left is None
-    assert root.left.val == 2
-    assert root.left.right.val == 5
-    assert root.left.right.right is None
-    assert root.left.right.left.val == 6
-    assert root.left.right.left.left is None
-    assert root.left.right.left.right is None
-    assert root.right.val == 3
-    assert root.right.left is None
-    assert root.right.right is None
+    assert root.values == [1, 2, 3, None, 5, None, None, None, None, 6]
     assert root.size == 5
 
     del root[2]
-    assert root.left.left is None
-    assert root.left.val == 2
-    assert root.left.right.val == 5
-    assert root.left.right.right is None
-    assert root.left.right.left.val == 6
-    assert root.left.right.left.left is None
-    assert root.left.right.left.right is None
-    assert root.right is None
+    assert root.values == [1, 2, None, None, 5, None, None, None, None, 6]
     assert root.size == 4
 
     del root[4]
-    assert root.left.left is None
-    assert root.left.right is None
-    assert root.right is None
+    assert root.values == [1, 2]
     assert root.size == 2
 
     del root[1]
-    assert root.left is None
-    assert root.right is None
+    assert root.values == [1]
     assert root.size == 1
 
 
-def test_tree_print_with_integers_no_index() -> None:
-    for printer in [builtin_print, pprint_default]:
-        lines = printer([1])
-        assert lines == ["1"]
-        lines = printer([1, 2])
-        assert lines == ["  1", " /", "2"]
-        lines = printer([1, None, 3])
-        assert lines == ["1", " \\", "  3"]
-        lines = printer([1, 2, 3])
-        assert lines == ["  1", " / \\", "2   3"]
-        lines = printer([1, 2, 3, None, 5])
-        assert lines == ["  __1", " /   \\", "2     3", " \\", "  5"]
-        lines = printer([1, 2, 3, None, 5, 6])
-        assert lines == ["  __1__", " /     \\", "2       3", " \\     /", "  5   6"]
-        lines = printer([1, 2, 3, None, 5, 6, 7])
-        assert lines == [
+PRINT_INTEGERS_NO_INDEX_CASES = (
+    ([1], ("1",)),
+    ([1, 2], ("  1", " /", "2")),
+    ([1, None, 3], ("1", " \\", "  3")),
+    ([1, 2, 3], ("  1", " / \\", "2   3")),
+    ([1, 2, 3, None, 5], ("  __1", " /   \\", "2     3", " \\", "  5")),
+    (
+        [1, 2, 3, None, 5, 6],
+        ("  __1__", " /     \\", "2       3", " \\     /", "  5   6"),
+    ),
+    (
+        [1, 2, 3, None, 5, 6, 7],
+        (
             "  __1__",
             " /     \\",
             "2       3",
             " \\     / \\",
             "  5   6   7",
-        ]
-        lines = printer([1, 2, 3, 8, 5, 6, 7])
-        assert lines == [
+        ),
+    ),
+    (
+        [1, 2, 3, 8, 5, 6, 7],
+        (
             "    __1__",
             "   /     \\",
             "  2       3",
             " / \\     / \\",
             "8   5   6   7",
-        ]
-
-
-def test_tree_print_with_integers_with_index() -> None:
-    lines = pprint_with_index([1])
-    assert lines == ["0:1"]
-    lines = pprint_with_index([1, 2])
-    assert lines == ["   _0:1", "  /", "1:2"]
-    lines = pprint_with_index([1, None, 3])
-    assert lines == ["0:1_", "    \\", "    2:3"]
-    lines = pprint_with_index([1, 2, 3])
-    assert lines == ["   _0:1_", "  /     \\", "1:2     2:3"]
-    lines = pprint_with_index([1, 2, 3, None, 5])
-    assert lines == [
-        "   _____0:1_",
-        "  /         \\",
-        "1:2_        2:3",
-        "    \\",
-        "    4:5",
-    ]
-    lines = pprint_with_index([1, 2, 3, None, 5, 6])
-    assert lines == [
-        "   _____0:1_____",
-        "  /             \\",
-        "1:2_           _2:3",
-        "    \\         /",
-        "    4:5     5:6",
-    ]
-    lines = pprint_with_index([1, 2, 3, None, 5, 6, 7])
-    assert lines == [
-        "   _____0:1_____",
-        "  /             \\",
-        "1:2_           _2:3_",
-        "    \\         /     \\",
-        "    4:5     5:6     6:7",
-    ]
-    lines = pprint_with_index([1, 2, 3, 8, 5, 6, 7])
-    assert lines == [
-        "       _____0:1_____",
-        "      /             \\",
-        "   _1:2_           _2:3_",
-        "  /     \\         /     \\",
-        "3:8     4:5     5:6     6:7",
-    ]
+        ),
+    ),
+)
 
+PRINT_INTEGERS_WITH_INDEX_CASES = (
+    ([1], ("0:1",)),
+    ([1, 2], ("   _0:1", "  /", "1:2")),
+    ([1, None, 3], ("0:1_", "    \\", "    2:3")),
+    ([1, 2, 3], ("   _0:1_", "  /     \\", "1:2     2:3")),
+    (
+        [1, 2, 3, None, 5],
+        (
+            "   _____0:1_",
+            "  /         \\",
+            "1:2_        2:3",
+            "    \\",
+            "    4:5",
+        ),
+    ),
+    (
+        [1, 2, 3, None, 5, 6],
+        (
+            "   _____0:1_____",
+            "  /             \\",
+            "1:2_           _2:3",
+            "    \\         /",
+            "    4:5     5:6",
+        ),
+    ),
+    (
+        [1, 2, 3, None, 5, 6, 7],
+        (
+            "   _____0:1_____",
+            "  /             \\",
+            "1:2_           _2:3_",
+            "    \\         /     \\",
+            "    4:5     5:6     6:7",
+        ),
+    ),
+    (
+        [1, 2, 3, 8, 5, 6, 7],
+        (
+            "       _____0:1_____",
+            "      /             \\",
+            "   _1:2_           _2:3_",
+            "  /     \\         /     \\",
+            "3:8     4:5     5:6     6:7",
+        ),
+    ),
+)
 
-def test_tree_print_with_letters_no_index() -> None:
-    for printer in [builtin_print, pprint_default]:
-        lines = printer(["A"])
-        assert lines == ["A"]
-        lines = printer(["A", "B"])
-        assert lines == ["  A", " /", "B"]
-        lines = printer(["A", None, "C"])
-        assert lines == ["A", " \\", "  C"]
-        lines = printer(["A", "B", "C"])
-        assert lines == ["  A", " / \\", "B   C"]
-        lines = printer(["A", "B", "C", None, "E"])
-        assert lines == ["  __A", " /   \\", "B     C", " \\", "  E"]
-        lines = printer(["A", "B", "C", None, "E", "F"])
-        assert lines == ["  __A__", " /     \\", "B       C", " \\     /", "  E   F"]
-        lines = printer(["A", "B", "C", None, "E", "F", "G"])
-        assert lines == [
+PRINT_LETTERS_NO_INDEX_CASES = (
+    (["A"], ("A",)),
+    (["A", "B"], ("  A", " /", "B")),
+    (["A", None, "C"], ("A", " \\", "  C")),
+    (["A", "B", "C"], ("  A", " / \\", "B   C")),
+    (["A", "B", "C", None, "E"], ("  __A", " /   \\", "B     C", " \\", "  E")),
+    (
+        ["A", "B", "C", None, "E", "F"],
+        ("  __A__", " /     \\", "B       C", " \\     /", "  E   F"),
+    ),
+    (
+        ["A", "B", "C", None, "E", "F", "G"],
+        (
             "  __A__",
             " /     \\",
             "B       C",
             " \\     / \\",
             "  E   F   G",
-        ]
-        lines = printer(["A", "B", "C", "D", "E", "F", "G"])
-        assert lines == [
+        ),
+    ),
+    (
+        ["A", "B", "C", "D", "E", "F", "G"],
+        (
             "    __A__",
             "   /     \\",
             "  B       C",
             " / \\     / \\",
             "D   E   F   G",
-        ]
-
-
-def test_tree_print_with_letters_with_index() -> None:
-    lines = pprint_with_index(["A"])
-    assert lines == ["0:A"]
-    lines = pprint_with_index(["A", "B"])
-    assert lines == ["   _0:A", "  /", "1:B"]
-    lines = pprint_with_index(["A", None, "C"])
-    assert lines == ["0:A_", "    \\", "    2:C"]
-    lines = pprint_with_index(["A", "B", "C"])
-    assert lines == ["   _0:A_", "  /     \\", "1:B     2:C"]
-    lines = pprint_with_index(["A", "B", "C", None, "E"])
-    assert lines == [
-        "   _____0:A_",
-        "  /         \\",
-        "1:B_        2:C",
-        "    \\",
-        "    4:E",
-    ]
-    lines = pprint_with_index(["A", "B", "C", None, "E", "F"])
-    assert lines == [
-        "   _____0:A_____",
-        "  /             \\",
-        "1:B_           _2:C",
-        "    \\         /",
-        "    4:E     5:F",
-    ]
-    lines = pprint_with_index(["A", "B", "C", None, "E", "F", "G"])
-    assert lines == [
-        "   _____0:A_____",
-        "  /             \\",
-        "1:B_           _2:C_",
-        "    \\         /     \\",
-        "    4:E     5:F     6:G",
-    ]
-    lines = pprint_with_index(["A", "B", "C", "D", "E", "F", "G"])
-    assert lines == [
-        "       _____0:A_____",
-        "      /             \\",
-        "   _1:B_           _2:C_",
-        "  /     \\         /     \\",
-        "3:D     4:E     5:F     6:G",
-    ]
+        ),
+    ),
+)
 
+PRINT_LETTERS_WITH_INDEX_CASES = (
+    (["A"], ("0:A",)),
+    (["A", "B"], ("   _0:A", "  /", "1:B")),
+    (["A", None, "C"], ("0:A_", "    \\", "    2:C")),
+    (["A", "B", "C"], ("   _0:A_", "  /     \\", "1:B     2:C")),
+    (
+        ["A", "B", "C", None, "E"],
+        (
+            "   _____0:A_",
+            "  /         \\",
+            "1:B_        2:C",
+            "    \\",
+            "    4:E",
+        ),
+    ),
+    (
+        ["A", "B", "C", None, "E", "F"],
+        (
+            "   _____0:A_____",
+            "  /             \\",
+            "1:B_           _2:C",
+            "    \\         /",
+            "    4:E     5:F",
+        ),
+    ),
+    (
+        ["A", "B", "C", None, "E", "F", "G"],
+        (
+            "   _____0:A_____",
+            "  /             \\",
+            "1:B_           _2:C_",
+            "    \\         /     \\",
+            "    4:E     5:F     6:G",
+        ),
+    ),
+    (
+        ["A", "B", "C", "D", "E", "F", "G"],
+        (
+            "       _____0:A_____",
+            "      /             \\",
+            "   _1:B_           _2:C_",
+            "  /     \\         /     \\",
+            "3:D     4:E     5:F     6:G",
+        ),
+    ),
+)
 
-def test_tree_validate() -> None:
-    class TestNode(Node):
-        def __setattr__(self, attr: str, value: Any) -> None:
-            object.__setattr__(self, attr, value)
 
-    root = Node(1)
-    root.validate()  # Should pass
+PRINT_FLOATS_NO_INDEX_CASES = (
+    ([1.0], ("1.0",)),
+    ([1.0, 2.0], ("   _1.0", "  /", "2.0")),
+    ([1.0, None, 3.0], ("1.0_", "    \\", "    3.0")),
+    ([1.0, 2.0, 3.0], ("   _1.0_", "  /     \\", "2.0     3.0")),
+    (
+        [1.0, 2.0, 3.0, None, 5.0],
+        (
+            "   _____1.0_",
+            "  /         \\",
+            "2.0_        3.0",
+            "    \\",
+            "    5.0",
+        ),
+    ),
+)
 
-    root = Node(1)
-    root.left = Node(2)
-    root.validate()  # Should pass
 
-    root = Node(1)
-    root.left = Node(2)
-    root.right = Node(3)
-    root.validate()  # Should pass
+@pytest.mark.parametrize("values,expected", PRINT_INTEGERS_NO_INDEX_CASES)
+def test_tree_print_with_integers_no_index(
+    printer: Printer,
+    values: NodeValueList,
+    expected: Tuple[str, ...],
+    capsys: "pytest.CaptureFixture[str]",
+) -> None:
+    assert tuple(printer(values, capsys)) == expected
 
-    root = Node(1)
-    root.left = Node(2)
-    root.right = Node(3)
-    root.left.left = Node(4)
-    root.left.right = Node(5)
-    root.left.right.left = Node(6)
-    root.validate()  # Should pass
 
-    root = TestNode(1)
-    root.left = "not_a_node"  # type: ignore
-    with pytest.raises(NodeTypeError) as err1:
-        root.validate()
-    assert str(err1.value) == "invalid node instance at index 1"
+@pytest.mark.parametrize("values,expected", PRINT_INTEGERS_WITH_INDEX_CASES)
+def test_tree_print_with_integers_with_index(
+    values: NodeValueList,
+    expected: Tuple[str, ...],
+    capsys: "pytest.CaptureFixture[str]",
+) -> None:
+    assert tuple(pprint_with_index(values, capsys)) == expected
 
-    root = TestNode(1)
-    root.right = TestNode(2)
-    root.right.val = EMPTY_LIST
-    with pytest.raises(NodeValueError) as err2:
-        root.validate()
-    assert str(err2.value) == "invalid node value at index 2"
 
-    root = TestNode(1)
-    root.left = TestNode(2)
-    root.left.right = root
-    with pytest.raises(NodeReferenceError) as err3:
-        root.validate()
-    assert str(err3.value) == "cyclic reference at Node(1) (level-order index 4)"
+@pytest.mark.parametrize("values,expected", PRINT_LETTERS_NO_INDEX_CASES)
+def test_tree_print_with_letters_no_index(
+    printer: Printer,
+    values: NodeValueList,
+    expected: Tuple[str, ...],
+    capsys: "pytest.CaptureFixture[str]",
+) -> None:
+    assert tuple(printer(values, capsys)) == expected
 
 
-def test_tree_validate_with_letters() -> None:
-    class TestNode(Node):
-        def __setattr__(self, attr: str, value: Any) -> None:
-            object.__setattr__(self, attr, value)
+@pytest.mark.parametrize("values,expected", PRINT_LETTERS_WITH_INDEX_CASES)
+def test_tree_print_with_letters_with_index(
+    values: NodeValueList,
+    expected: Tuple[str, ...],
+    capsys: "pytest.CaptureFixture[str]",
+) -> None:
+    assert tuple(pprint_with_index(values, capsys)) == expected
 
-    root = Node("A")
-    root.validate()  # Should pass
 
-    root = Node("A")
-    root.left = Node("B")
-    root.validate()  # Should pass
+@pytest.mark.parametrize("values,expected", PRINT_FLOATS_NO_INDEX_CASES)
+def test_tree_print_with_floats_no_index(
+    printer: Printer,
+    values: NodeValueList,
+    expected: Tuple[str, ...],
+    capsys: "pytest.CaptureFixture[str]",
+) -> None:
+    assert tuple(printer(values, capsys)) == expected
 
-    root = Node("A")
-    root.left = Node("B")
-    root.right = Node(3)
-    root.validate()  # Should pass
 
-    root = Node("A")
-    root.left = Node("B")
-    root.right = Node(3)
-    root.left.left = Node(4)
-    root.left.right = Node(5)
-    root.left.right.left = Node(6)
-    root.validate()  # Should pass
+class UncheckedNode(Node):
+    """Node that skips attribute validation, used to build invalid trees."""
 
-    root = TestNode("A")
+    def __setattr__(self, attr: str, value: Any) -> None:
+        object.__setattr__(self, attr, value)
+
+
+@pytest.mark.parametrize("a,b", [(1, 2), ("A", "B")], ids=["integers", "letters"])
+def test_tree_validate(a: Any, b: Any) -> None:
+    for values in ([a], [a, b], [a, b, 3], [a, b, 3, 4, 5, None, None, None, None, 6]):
+        root = build(values)
+        assert root is not None
+        root.validate()  # Should pass
+
+    root = UncheckedNode(a)
     root.left = "not_a_node"  # type: ignore
-    with pytest.raises(NodeTypeError) as err1:
+    with pytest.raises(
+        NodeTypeError, match=exact_message("invalid node instance at index 1")
+    ):
         root.validate()
-    assert str(err1.value) == "invalid node instance at index 1"
 
-    root = TestNode("A")
-    root.right = TestNode("B")
-    root.right.val = EMPTY_LIST
-    with pytest.raises(NodeValueError) as err2:
+    root = UncheckedNode(a)
+    root.right = UncheckedNode(b)
+    root.right.val = EMPTY_VALUE
+    with pytest.raises(
+        NodeValueError, match=exact_message("invalid node value at index 2")
+    ):
         root.validate()
-    assert str(err2.value) == "invalid node value at index 2"
 
-    root = TestNode("A")
-    root.left = TestNode("B")
+    root = UncheckedNode(a)
+    root.left = UncheckedNode(b)
     root.left.right = root
-    with pytest.raises(NodeReferenceError) as err3:
+    with pytest.raises(
+        NodeReferenceError,
+        match=exact_message(
+            "cyclic reference at Node({}) (level-order index 4)".format(a)
+        ),
+    ):
         root.validate()
-    assert str(err3.value) == "cyclic reference at Node(A) (level-order index 4)"
 
 
-def test_tree_properties() -> None:
-    root = Node(1)
-    assert root.properties == {
-        "height": 0,
-        "is_balanced": True,
-        "is_bst": True,
-        "is_complete": True,
-        "is_max_heap": True,
-        "is_min_heap": True,
-        "is_perfect": True,
-        "is_strict": True,
-        "is_symmetric": True,
-        "leaf_count": 1,
-        "max_leaf_depth": 0,
-        "max_node_value": 1,
-        "min_leaf_depth": 0,
-        "min_node_value": 1,
-        "size": 1,
+@pytest.mark.parametrize("values,expected", TREE_PROPERTIES)
+def test_tree_properties(values: NodeValueList, expected: Mapping[str, Any]) -> None:
+    root = build(values)
+    assert root is not None
+    properties = root.properties
+    assert properties == expected
+    assert {name: type(value) for name, value in properties.items()} == {
+        name: type(value) for name, value in expected.items()
     }
-    assert root.height == 0
-    assert root.is_balanced is True
-    assert root.is_bst is True
-    assert root.is_complete is True
-    assert root.is_max_heap is True
-    assert root.is_min_heap is True
-    assert root.is_perfect is True
-    assert root.is_strict is True
-    assert root.is_symmetric is True
-    assert root.leaf_count == 1
-    assert root.max_leaf_depth == 0
-    assert root.max_node_value == 1
-    assert root.min_leaf_depth == 0
-    assert root.min_node_value == 1
-    assert root.size == len(root) == 1
+    assert len(root) == properties["size"]
 
-    root.left = Node(2)
-    assert root.properties == {
-        "height": 1,
-        "is_balanced": True,
-        "is_bst": False,
-        "is_complete": True,
-        "is_max_heap": False,
-        "is_min_heap": True,
-        "is_perfect": False,
-        "is_strict": False,
-        "is_symmetric": False,
-        "leaf_count": 1,
-        "max_leaf_depth": 1,
-        "max_node_value": 2,
-        "min_leaf_depth": 1,
-        "min_node_value": 1,
-        "size": 2,
-    }
-    assert root.height == 1
-    assert root.is_balanced is True
-    assert root.is_bst is False
-    assert root.is_complete is True
-    assert root.is_max_heap is False
-    assert root.is_min_heap is True
-    assert root.is_perfect is False
-    assert root.is_strict is False
-    assert root.is_symmetric is False
-    assert root.leaf_count == 1
-    assert root.max_leaf_depth == 1
-    assert root.max_node_value == 2
-    assert root.min_leaf_depth == 1
-    assert root.min_node_value == 1
-    assert root.size == len(root) == 2
 
-    root.right = Node(3)
-    assert root.properties == {
-        "height": 1,
-        "is_balanced": True,
-        "is_bst": False,
-        "is_complete": True,
-        "is_max_heap": False,
-        "is_min_heap": True,
-        "is_perfect": True,
-        "is_strict": True,
-        "is_symmetric": False,
-        "leaf_count": 2,
-        "max_leaf_depth": 1,
-        "max_node_value": 3,
-        "min_leaf_depth": 1,
-        "min_node_value": 1,
-        "size": 3,
-    }
-    assert root.height == 1
-    assert root.is_balanced is True
-    assert root.is_bst is False
-    assert root.is_complete is True
-    assert root.is_max_heap is False
-    assert root.is_min_heap is True
-    assert root.is_perfect is True
-    assert root.is_strict is True
-    assert root.is_symmetric is False
-    assert root.leaf_count == 2
-    assert root.max_leaf_depth == 1
-    assert root.max_node_value == 3
-    assert root.min_leaf_depth == 1
-    assert root.min_node_value == 1
-    assert root.size == len(root) == 3
+@pytest.mark.parametrize("values,expected", TREE_PROPERTIES)
+def test_tree_property_getters(
+    values: NodeValueList, expected: Mapping[str, Any]
+) -> None:
+    root = build(values)
+    assert root is not None
+    for name, expected_value in expected.items():
+        actual = getattr(root, name)
+        assert (actual, type(actual)) == (expected_value, type(expected_value))
 
-    root.left.left = Node(4)
-    assert root.properties == {
-        "height": 2,
-        "is_balanced": True,
-        "is_bst": False,
-        "is_complete": True,
-        "is_max_heap": False,
-        "is_min_heap": True,
-        "is_perfect": False,
-        "is_strict": False,
-        "is_symmetric": False,
-        "leaf_count": 2,
-        "max_leaf_depth": 2,
-        "max_node_value": 4,
-        "min_leaf_depth": 1,
-        "min_node_value": 1,
-        "size": 4,
-    }
-    assert root.height == 2
-    assert root.is_balanced is True
-    assert root.is_bst is False
-    assert root.is_complete is True
-    assert root.is_max_heap is False
-    assert root.is_min_heap is True
-    assert root.is_perfect is False
-    assert root.is_strict is False
-    assert root.is_symmetric is False
-    assert root.leaf_count == 2
-    assert root.max_leaf_depth == 2
-    assert root.max_node_value == 4
-    assert root.min_leaf_depth == 1
-    assert root.min_node_value == 1
-    assert root.size == len(root) == 4
 
-    root.right.left = Node(5)
-    assert root.properties == {
-        "height": 2,
-        "is_balanced": True,
-        "is_bst": False,
-        "is_complete": False,
-        "is_max_heap": False,
-        "is_min_heap": False,
-        "is_perfect": False,
-        "is_strict": False,
-        "is_symmetric": False,
-        "leaf_count": 2,
-        "max_leaf_depth": 2,
-        "max_node_value": 5,
-        "min_leaf_depth": 2,
-        "min_node_value": 1,
-        "size": 5,
-    }
-    assert root.height == 2
-    assert root.is_balanced is True
-    assert root.is_bst is False
-    assert root.is_complete is False
-    assert root.is_max_heap is False
-    assert root.is_min_heap is False
-    assert root.is_perfect is False
-    assert root.is_strict is False
-    assert root.is_symmetric is False
-    assert root.leaf_count == 2
-    assert root.max_leaf_depth == 2
-    assert root.max_node_value == 5
-    assert root.min_leaf_depth == 2
-    assert root.min_node_value == 1
-    assert root.size == len(root) == 5
-
-    root.right.left.left = Node(6)
-    assert root.properties == {
-        "height": 3,
-        "is_balanced": False,
-        "is_bst": False,
-        "is_complete": False,
-        "is_max_heap": False,
-        "is_min_heap": False,
-        "is_perfect": False,
-        "is_strict": False,
-        "is_symmetric": False,
-        "leaf_count": 2,
-        "max_leaf_depth": 3,
-        "max_node_value": 6,
-        "min_leaf_depth": 2,
-        "min_node_value": 1,
-        "size": 6,
-    }
-    assert root.height == 3
-    assert root.is_balanced is False
-    assert root.is_bst is False
-    assert root.is_complete is False
-    assert root.is_max_heap is False
-    assert root.is_min_heap is False
-    assert root.is_perfect is False
-    assert root.is_strict is False
-    assert root.is_symmetric is False
-    assert root.leaf_count == 2
-    assert root.max_leaf_depth == 3
-    assert root.max_node_value == 6
-    assert root.min_leaf_depth == 2
-    assert root.min_node_value == 1
-    assert root.size == len(root) == 6
-
-    root.left.left.left = Node(7)
-    assert root.properties == {
-        "height": 3,
-        "is_balanced": False,
-        "is_bst": False,
-        "is_complete": False,
-        "is_max_heap": False,
-        "is_min_heap": False,
-        "is_perfect": False,
-        "is_strict": False,
-        "is_symmetric": False,
-        "leaf_count": 2,
-        "max_leaf_depth": 3,
-        "max_node_value": 7,
-        "min_leaf_depth": 3,
-        "min_node_value": 1,
-        "size": 7,
-    }
-    assert root.height == 3
-    assert root.is_balanced is False
-    assert root.is_bst is False
-    assert root.is_complete is False
-    assert root.is_max_heap is False
-    assert root.is_min_heap is False
-    assert root.is_perfect is False
-    assert root.is_strict is False
-    assert root.is_symmetric is False
-    assert root.leaf_count == 2
-    assert root.max_leaf_depth == 3
-    assert root.max_node_value == 7
-    assert root.min_leaf_depth == 3
-    assert root.min_node_value == 1
-    assert root.size == len(root) == 7
+def traversals(root: Node) -> Tuple[List[Any], ...]:
+    """Return the node values of every traversal of the given tree."""
+    return (
+        [[node.val for node in level] for level in root.levels],
+        [node.val for node in root.leaves],
+        [node.val for node in root.inorder],
+        [node.val for node in root.preorder],
+        [node.val for node in root.postorder],
+        [node.val for node in root.levelorder],
+    )
 
 
 def test_tree_traversal() -> None:
     n1 = Node(1)
-    assert n1.levels == [[n1]]
-    assert n1.leaves == [n1]
-    assert n1.inorder == [n1]
-    assert n1.preorder == [n1]
-    assert n1.postorder == [n1]
-    assert n1.levelorder == [n1]
+    assert traversals(n1) == ([[1]], [1], [1], [1], [1], [1])
 
     n2 = Node(2)
     n1.left = n2
-    assert n1.levels == [[n1], [n2]]
-    assert n1.leaves == [n2]
-    assert n1.inorder == [n2, n1]
-    assert n1.preorder == [n1, n2]
-    assert n1.postorder == [n2, n1]
-    assert n1.levelorder == [n1, n2]
+    assert traversals(n1) == ([[1], [2]], [2], [2, 1], [1, 2], [2, 1], [1, 2])
 
     n3 = Node(3)
     n1.right = n3
-    assert n1.levels == [[n1], [n2, n3]]
-    assert n1.leaves == [n2, n3]
-    assert n1.inorder == [n2, n1, n3]
-    assert n1.preorder == [n1, n2, n3]
-    assert n1.postorder == [n2, n3, n1]
-    assert n1.levelorder == [n1, n2, n3]
+    assert traversals(n1) == (
+        [[1], [2, 3]],
+        [2, 3],
+        [2, 1, 3],
+        [1, 2, 3],
+        [2, 3, 1],
+        [1, 2, 3],
+    )
 
     n4 = Node(4)
     n5 = Node(5)
     n2.left = n4
     n2.right = n5
+    assert traversals(n1) == (
+        [[1], [2, 3], [4, 5]],
+        [3, 4, 5],
+        [4, 2, 5, 1, 3],
+        [1, 2, 4, 5, 3],
+        [4, 5, 2, 3, 1],
+        [1, 2, 3, 4, 5],
+    )
 
-    assert n1.levels == [[n1], [n2, n3], [n4, n5]]
-    assert n1.leaves == [n3, n4, n5]
-    assert n1.inorder == [n4, n2, n5, n1, n3]
-    assert n1.preorder == [n1, n2, n4, n5, n3]
-    assert n1.postorder == [n4, n5, n2, n3, n1]
-    assert n1.levelorder == [n1, n2, n3, n4, n5]
 
+@pytest.mark.parametrize("builder", [tree, bst, heap])
+@pytest.mark.parametrize("invalid_height", ["foo", -1, None])
+def test_generation_with_invalid_height(
+    builder: Callable[..., Optional[Node]], invalid_height: Any
+) -> None:
+    with pytest.raises(TreeHeightError, match=INVALID_TREE_HEIGHT):
+        builder(height=invalid_height)
 
-def test_tree_generation() -> None:
-    for invalid_height in ["foo", -1, None]:
-        with pytest.raises(TreeHeightError) as err:
-            tree(height=invalid_height)  # type: ignore
-        assert str(err.value) == "height must be an int between 0 - 9"
 
+def test_tree_generation() -> None:
     root = tree(height=0)
     assert root is not None
 
@@ -1237,34 +939,26 @@ def test_tree_generation() -> None:
     assert root.right is None
     assert isinstance(root.val, int)
 
-    for _ in range(REPETITIONS):
-        random_height = random.randint(1, 9)
 
-        root = tree(random_height)
-        assert root is not None
+@pytest.mark.parametrize("seed", range(REPETITIONS))
+def test_random_tree_generation(seed: int) -> None:
+    random.seed(seed)
 
-        root.validate()
-        assert root.height == random_height
-
-    for _ in range(REPETITIONS):
-        random_height = random.randint(1, 9)
-
-        root = tree(random_height, is_perfect=True)
-        assert root is not None
+    random_height, perfect_height = random.choices(range(1, 10), k=2)
+    root = tree(random_height)
+    assert root is not None
+    assert root.height == random_height
 
-        root.validate()
-        assert root.height == random_height
-        assert root.is_perfect is True
-        assert root.is_balanced is True
-        assert root.is_strict is True
+    root = tree(perfect_height, is_perfect=True)
+    assert root is not None
+    properties = root.properties
+    assert properties["height"] == perfect_height
+    assert properties["is_perfect"] is True
+    assert properties["is_balanced"] is True
+    assert properties["is_strict"] is True
 
 
 def test_bst_generation() -> None:
-    for invalid_height in ["foo", -1, None]:
-        with pytest.raises(TreeHeightError) as err:
-            bst(height=invalid_height)  # type: ignore
-        assert str(err.value) == "height must be an int between 0 - 9"
-
     root = bst(height=0)
     assert root is not None
     root.validate()
@@ -1273,59 +967,29 @@ def test_bst_generation() -> None:
     assert root.right is None
     assert isinstance(root.val, int)
 
-    for _ in range(REPETITIONS):
-        random_height = random.randint(1, 9)
-        root = bst(random_height)
-        assert root is not None
-        root.validate()
-        assert root.is_bst is True
-        assert root.height == random_height
 
-    for _ in range(REPETITIONS):
-        random_height = random.randint(1, 9)
-        root = bst(random_height, letters=True)
-        assert root is not None
-        root.validate()
-        assert root.is_bst is True
-        assert root.height == random_height
+@pytest.mark.parametrize("seed", range(REPETITIONS))
+def test_random_bst_generation(seed: int) -> None:
+    random.seed(seed)
 
-    for _ in range(REPETITIONS):
-        random_height = random.randint(1, 9)
-        root = bst(random_height, is_perfect=True)
+    for letters, random_height in zip([False, True], random.choices(range(1, 10), k=2)):
+        root = bst(random_height, letters=letters)
         assert root is not None
-        root.validate()
-        assert root.height == random_height
-
-        if not root.is_bst:
-            raise Exception("boo")
-
         assert root.is_bst is True
-        assert root.is_perfect is True
-        assert root.is_balanced is True
-        assert root.is_strict is True
-
-    for _ in range(REPETITIONS):
-        random_height = random.randint(1, 9)
-        root = bst(random_height, letters=True, is_perfect=True)
-        assert root is not None
-        root.validate()
         assert root.height == random_height
 
-        if not root.is_bst:
-            raise Exception("boo")
-
-        assert root.is_bst is True
-        assert root.is_perfect is True
-        assert root.is_balanced is True
-        assert root.is_strict is True
+    for letters, random_height in zip([False, True], random.choices(range(1, 10), k=2)):
+        root = bst(random_height, letters=letters, is_perfect=True)
+        assert root is not None
+        properties = root.properties
+        assert properties["height"] == random_height
+        assert properties["is_bst"] is True
+        assert properties["is_perfect"] is True
+        assert properties["is_balanced"] is True
+        assert properties["is_strict"] is True
 
 
 def test_heap_generation() -> None:
-    for invalid_height in ["foo", -1, None]:
-        with pytest.raises(TreeHeightError) as err:
-            heap(height=invalid_height)  # type: ignore
-        assert str(err.value) == "height must be an int between 0 - 9"
-
     root = heap(height=0)
     assert root is not None
     root.validate()
@@ -1334,65 +998,46 @@ def test_heap_generation() -> None:
     assert root.right is None
     assert isinstance(root.val, int)
 
-    for _ in range(REPETITIONS):
-        random_height = random.randint(1, 9)
-        root = heap(random_height, is_max=True)
-        assert root is not None
-        root.validate()
-        assert root.is_max_heap is True
-        assert root.is_min_heap is False
-        assert root.height == random_height
 
-    for _ in range(REPETITIONS):
-        random_height = random.randint(1, 9)
-        root = heap(random_height, letters=True, is_max=True)
-        assert root is not None
-        root.validate()
-        assert root.is_max_heap is True
-        assert root.is_min_heap is False
-        assert root.height == random_height
+@pytest.mark.parametrize("seed", range(REPETITIONS))
+@pytest.mark.parametrize("letters", [False, True])
+@pytest.mark.parametrize("is_max", [True, False])
+def test_random_heap_generation(seed: int, letters: bool, is_max: bool) -> None:
+    random.seed(seed)
+    random_height, perfect_height = random.choices(range(1, 10), k=2)
 
-    for _ in range(REPETITIONS):
-        random_height = random.randint(1, 9)
-        root = heap(random_height, is_max=False)
-        assert root is not None
-        root.validate()
-        assert root.is_max_heap is False
-        assert root.is_min_heap is True
-        assert root.height == random_height
-
-    for _ in range(REPETITIONS):
-        random_height = random.randint(1, 9)
-        root = heap(random_height, letters=True, is_max=False)
-        assert root is not None
-        root.validate()
-        assert root.is_max_heap is False
-        assert root.is_min_heap is True
-        assert root.height == random_height
-
-    for _ in range(REPETITIONS):
-        random_height = random.randint(1, 9)
-        root = heap(random_height, is_perfect=True)
-        assert root is not None
-        root.validate()
-        assert root.is_max_heap is True
-        assert root.is_min_heap is False
-        assert root.is_perfect is True
-        assert root.is_balanced is True
-        assert root.is_strict is True
-        assert root.height == random_height
+    root = heap(random_height, letters=letters, is_max=is_max)
+    assert root is not None
+    assert root.is_max_heap is is_max
+    assert root.is_min_heap is (not is_max)
+    assert root.height == random_height
 
-    for _ in range(REPETITIONS):
-        random_height = random.randint(1, 9)
-        root = heap(random_height, letters=True, is_perfect=True)
+    root = heap(perfect_height, letters=letters, is_max=is_max, is_perfect=True)
+    assert root is not None
+    properties = root.properties
+    assert properties["is_max_heap"] is is_max
+    assert properties["is_min_heap"] is (not is_max)
+    assert properties["is_perfect"] is True
+    assert properties["is_balanced"] is True
+    assert properties["is_strict"] is True
+    assert properties["height"] == perfect_height
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "builder",
+    [tree, bst, heap, partial(heap, is_max=False)],
+    ids=["tree", "bst", "max_heap", "min_heap"],
+)
+@pytest.mark.parametrize("is_perfect", [False, True])
+@pytest.mark.parametrize("letters", [False, True])
+def test_generated_tree_validation(
+    builder: Callable[..., Optional[Node]], is_perfect: bool, letters: bool
+) -> None:
+    for random_height in random.choices(range(1, 10), k=REPETITIONS):
+        root = builder(random_height, is_perfect=is_perfect, letters=letters)
         assert root is not None
         root.validate()
-        assert root.is_max_heap is True
-        assert root.is_min_heap is False
-        assert root.is_perfect is True
-        assert root.is_balanced is True
-        assert root.is_strict is True
-        assert root.height == random_height
 
 
 def test_heap_float_values() -> None:
@@ -1415,49 +1060,29 @@ def test_heap_float_values() -> None:
     assert root.min_node_value == 0.5
     assert root.size == 3
 
-    for printer in [builtin_print, pprint_default]:
-        lines = printer([1.0])
-        assert lines == ["1.0"]
-        lines = printer([1.0, 2.0])
-        assert lines == ["   _1.0", "  /", "2.0"]
-        lines = printer([1.0, None, 3.0])
-        assert lines == ["1.0_", "    \\", "    3.0"]
-        lines = printer([1.0, 2.0, 3.0])
-        assert lines == ["   _1.0_", "  /     \\", "2.0     3.0"]
-        lines = printer([1.0, 2.0, 3.0, None, 5.0])
-        assert lines == [
-            "   _____1.0_",
-            "  /         \\",
-            "2.0_        3.0",
-            "    \\",
-            "    5.0",
-        ]
-
-
-def test_heap_float_values_builders() -> None:
-    for builder in [tree, bst, heap]:
-        for _ in range(REPETITIONS):
-            root = builder()  # type: ignore
-            root_copy = copy.deepcopy(root)
-
-            for node in root:
-                node.value += 0.1
-
-            assert root.height == root_copy.height
-            assert root.is_balanced == root_copy.is_balanced
-            assert root.is_bst == root_copy.is_bst
-            assert root.is_complete == root_copy.is_complete
-            assert root.is_max_heap == root_copy.is_max_heap
-            assert root.is_min_heap == root_copy.is_min_heap
-            assert root.is_perfect == root_copy.is_perfect
-            assert root.is_strict == root_copy.is_strict
-            assert root.is_symmetric == root_copy.is_symmetric
-            assert root.leaf_count == root_copy.leaf_count
-            assert root.max_leaf_depth == root_copy.max_leaf_depth
-            assert root.max_node_value == root_copy.max_node_value + 0.1
-            assert root.min_leaf_depth == root_copy.min_leaf_depth
-            assert root.min_node_value == root_copy.min_node_value + 0.1
-            assert root.size == root_copy.size
+
+@pytest.fixture(scope="module", params=[tree, bst, heap])
+def generated_tree_values(request: pytest.FixtureRequest) -> List[NodeValueList]:
+    """Return list representations of trees from each builder, generated once."""
+    random.seed(0)
+    trees = [request.param() for _ in range(REPETITIONS)]
+    return [root.values for root in trees if root is not None]
+
+
+@pytest.mark.parametrize("index", range(REPETITIONS))
+def test_heap_float_values_builders(
+    generated_tree_values: List[NodeValueList], index: int
+) -> None:
+    root = build(generated_tree_values[index])
+    assert root is not None
+    expected = root.properties
+    expected["max_node_value"] += 0.1
+    expected["min_node_value"] += 0.1
+
+    for node in root:
+        node.value += 0.1
+
+    assert root.properties == expected
 
 
 def test_get_index_utility_function() -> None:
@@ -1473,17 +1098,20 @@ def test_get_index_utility_function() -> None:
     assert get_index(root, root.left.left) == 3
     assert get_index(root, root.right.right) == 6
 
-    with pytest.raises(NodeReferenceError) as err1:
+    with pytest.raises(
+        NodeReferenceError, match=exact_message("given nodes are not in the same tree")
+    ):
         get_index(root.left, root.right)
-    assert str(err1.value) == "given nodes are not in the same tree"
 
-    with pytest.raises(NodeTypeError) as err2:
+    with pytest.raises(
+        NodeTypeError, match=exact_message("descendent must be a Node instance")
+    ):
         get_index(root, None)  # type: ignore
-    assert str(err2.value) == "descendent must be a Node instance"
 
-    with pytest.raises(NodeTypeError) as err3:
+    with pytest.raises(
+        NodeTypeError, match=exact_message("root must be a Node instance")
+    ):
         get_index(None, root.left)  # type: ignore
-    assert str(err3.value) == "root must be a Node instance"
 
 
 def test_get_parent_utility_function() -> None:
@@ -1525,11 +1153,9 @@ def test_number_to_letters_utility_function() -> None:
     assert number_to_letters(51) == "ZZ"
     assert number_to_letters(52) == "ZZA"
 
-    for _ in range(REPETITIONS):
-        num1 = random.randint(0, 1000)
-        num2 = random.randint(0, 1000)
-        str1 = number_to_letters(num1)
-        str2 = number_to_letters(num2)
-        assert (num1 < num2) == (str1 < str2)
-        assert (num1 > num2) == (str1 > str2)
-        assert (num1 == num2) == (str1 == str2)
+    nums = random.choices(range(1001), k=REPETITIONS * 2)
+    num_pairs = list(zip(nums[::2], nums[1::2]))
+    str_pairs = [(number_to_letters(n1), number_to_letters(n2)) for n1, n2 in num_pairs]
+    assert [(n1 < n2, n1 > n2, n1 == n2) for n1, n2 in num_pairs] == [
+        (s1 < s2, s1 > s2, s1 == s2) for s1, s2 in str_pairs
+    ]
@@ -1,60 +1,54 @@
-from __future__ import absolute_import, unicode_literals
+import re
+from typing import Callable, List, Pattern
 
-import sys
-from typing import Any, List
-
-try:
-    # noinspection PyCompatibility
-    from StringIO import StringIO
-except ImportError:
-    from io import StringIO
+import pytest
 
 from binarytree import NodeValueList, build
 
+# Signature shared by the print helpers below.
+Printer = Callable[[NodeValueList, "pytest.CaptureFixture[str]"], List[str]]
 
-class CaptureOutput(List[str]):
-    """Context manager to catch stdout."""
-
-    def __enter__(self) -> "CaptureOutput":
-        self._original_stdout = sys.stdout
-        self._temp_stdout = StringIO()
-        sys.stdout = self._temp_stdout
-        return self
 
-    def __exit__(self, *args: Any) -> None:
-        lines = self._temp_stdout.getvalue().splitlines()
-        self.extend(line.rstrip() for line in lines)
-        sys.stdout = self._original_stdout
+def _output_lines(capsys: "pytest.CaptureFixture[str]") -> List[str]:
+    """Return the non-empty lines written to stdout since the last read."""
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].rstrip() == "" and lines[-1].rstrip() == ""
+    return [line for line in map(str.rstrip, lines) if line]
 
 
-def pprint_default(values: NodeValueList) -> List[str]:
+def pprint_default(
+    values: NodeValueList, capsys: "pytest.CaptureFixture[str]"
+) -> List[str]:
     """Helper function for testing Node.pprint with default arguments."""
     root = build(values)
     assert root is not None
 
-    with CaptureOutput() as output:
-        root.pprint(index=False, delimiter="-")
-    assert output[0] == "" and output[-1] == ""
-    return [line for line in output if line != ""]
+    root.pprint(index=False, delimiter="-")
+    return _output_lines(capsys)
 
 
-def pprint_with_index(values: NodeValueList) -> List[str]:
+def pprint_with_index(
+    values: NodeValueList, capsys: "pytest.CaptureFixture[str]"
+) -> List[str]:
     """Helper function for testing Node.pprint with indexes."""
     root = build(values)
     assert root is not None
 
-    with CaptureOutput() as output:
-        root.pprint(index=True, delimiter=":")
-    assert output[0] == "" and output[-1] == ""
-    return [line for line in output if line != ""]
+    root.pprint(index=True, delimiter=":")
+    return _output_lines(capsys)
 
 
-def builtin_print(values: NodeValueList) -> List[str]:
+def builtin_print(
+    values: NodeValueList, capsys: "pytest.CaptureFixture[str]"
+) -> List[str]:
     """Helper function for testing builtin print on Node."""
     root = build(values)
     assert root is not None
 
-    with CaptureOutput() as output:
-        print(root)
-    assert output[0] == "" and output[-1] == ""
-    return [line for line in output if line != ""]
+    print(root)
+    return _output_lines(capsys)
+
+
+def exact_message(message: str) -> Pattern[str]:
+    """Return a compiled pattern for ``pytest.raises`` matching the whole message."""
+    return re.compile("^{}$".format(re.escape(message)))